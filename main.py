@@ -1,14 +1,79 @@
+import asyncio
+import logging
+import logging.handlers
 import os
+import queue
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+import anyio.to_thread
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from ebay_sold_itempages import BrowserPool
 from ebay_sold_itempages import main as run_scrape  # uses run_with_retries
 
+# Scraper progress goes through `logging`; per-item detail is DEBUG, so
+# LOG_LEVEL=DEBUG brings it back and WARNING silences routine progress.
+logging.basicConfig(
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+)
+log = logging.getLogger(__name__)
+
+
+def _start_log_listener() -> logging.handlers.QueueListener:
+    """Route root logging through a queue; a thread does the stdout writes, never the event loop."""
+    root = logging.getLogger()
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(records, *root.handlers, respect_handler_level=True)
+    root.handlers = [logging.handlers.QueueHandler(records)]
+    listener.start()
+    return listener
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Keep warm Chromium browsers/contexts for the lifetime of the process."""
+    log_listener = _start_log_listener()
+
+    # All handlers are async; keep stray sync work from fanning out threads
+    max_threads = int(os.environ.get("MAX_WORKER_THREADS", "4"))
+    anyio.to_thread.current_default_thread_limiter().total_tokens = max_threads
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=max_threads))
+
+    pool: t.Optional[BrowserPool] = BrowserPool(
+        browsers=int(os.environ.get("BROWSER_POOL_BROWSERS", "1")),
+        contexts_per_browser=int(os.environ.get("BROWSER_POOL_CONTEXTS", "2")),
+        headless=True,
+    )
+    try:
+        await pool.start()
+    except Exception as exc:
+        # Scrapes still work, they just launch a browser per request
+        log.warning("⚠️ Browser pool failed to start, falling back to per-request launch: %s", exc)
+        await pool.close()
+        pool = None
+
+    app.state.browser_pool = pool
+    try:
+        yield
+    finally:
+        if pool is not None:
+            await pool.close()
+        log_listener.stop()
+        logging.getLogger().handlers = list(log_listener.handlers)
+
+
 app = FastAPI(
     title="FastAPI Scraper",
     version="1.1.0",
     description="Playwright-powered scraper (Railway / Docker).",
+    lifespan=lifespan,
+    # Handlers return plain dicts; orjson encodes large item lists much faster
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -27,7 +92,7 @@ app.add_middleware(
 
 
 @app.get("/")
-def root():
+async def root():
     return {
         "service": "fastapi-scraper",
         "endpoints": {
@@ -40,13 +105,25 @@ def root():
 
 
 @app.get("/health")
-def health():
+async def health():
     return {
         "status": "ok",
         "environment": "production" if os.environ.get("VERCEL") else "development",
     }
 
 
+async def _run_pooled(query: str, *, proxy: t.Optional[str] = None, **kwargs) -> t.Dict[str, t.Any]:
+    """Run on a warm pooled context when available (headless only)."""
+    pool: t.Optional[BrowserPool] = getattr(app.state, "browser_pool", None)
+    if pool is None or not kwargs.get("headless", True):
+        return await run_scrape(query, proxy=proxy, **kwargs)
+
+    async with pool.checkout(proxy=proxy) as slot:
+        return await run_scrape(
+            query, context=slot.context, page=slot.page, item_pages=slot.item_pages, **kwargs
+        )
+
+
 @app.get("/smoke")
 async def smoke():
     """
@@ -54,7 +131,7 @@ async def smoke():
     Uses run_scrape(..., smoke=True) which hits example.com.
     """
     try:
-        data = await run_scrape(
+        data = await _run_pooled(
             "__SMOKE__",
             pages=1,
             per_page=1,
@@ -78,6 +155,7 @@ async def scrape(
     proxy: t.Optional[str] = None,
     dummy: bool = False,
     mobile: bool = False,
+    fast_path_only: bool = False,
 ):
     """
     Public scraping endpoint.
@@ -101,6 +179,7 @@ async def scrape(
                 "headless": headless,
                 "usd_rate": usd_rate,
                 "mobile": mobile,
+                "fast_path_only": fast_path_only,
             },
         }
 
@@ -108,17 +187,9 @@ async def scrape(
     pages = max(1, min(pages, 50))
     per_page = max(1, min(per_page, 200))
 
-    # Optional proxy support
-    old_http = os.environ.get("PLAYWRIGHT_HTTP_PROXY")
-    old_https = os.environ.get("PLAYWRIGHT_HTTPS_PROXY")
-
     try:
-        if proxy:
-            os.environ["PLAYWRIGHT_HTTP_PROXY"] = proxy
-            os.environ["PLAYWRIGHT_HTTPS_PROXY"] = proxy
-
         # run_scrape is async (run_with_retries)
-        data = await run_scrape(
+        data = await _run_pooled(
             query,
             pages=pages,
             per_page=per_page,
@@ -126,6 +197,8 @@ async def scrape(
             usd_rate=usd_rate,
             mobile=mobile,
             smoke=False,
+            fast_path_only=fast_path_only,
+            proxy=proxy,
         )
 
         if data is None:
@@ -138,22 +211,8 @@ async def scrape(
         return data
 
     except Exception as exc:
-        import traceback
-
-        print("❌ /scrape unhandled error:", exc)
-        print(traceback.format_exc())
+        log.exception("❌ /scrape unhandled error: %s", exc)
         return {
             "success": False,
             "error": f"/scrape failed: {type(exc).__name__}: {exc}",
         }
-    finally:
-        # Restore proxy env vars
-        if old_http is not None:
-            os.environ["PLAYWRIGHT_HTTP_PROXY"] = old_http
-        elif "PLAYWRIGHT_HTTP_PROXY" in os.environ:
-            del os.environ["PLAYWRIGHT_HTTP_PROXY"]
-
-        if old_https is not None:
-            os.environ["PLAYWRIGHT_HTTPS_PROXY"] = old_https
-        elif "PLAYWRIGHT_HTTPS_PROXY" in os.environ:
-            del os.environ["PLAYWRIGHT_HTTPS_PROXY"]
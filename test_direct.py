@@ -1,4 +1,5 @@
 import asyncio
+import logging
 import sys
 import os
 
@@ -8,6 +9,7 @@ sys.path.append(os.getcwd())
 from ebay_sold_itempages import run
 
 async def main():
+    logging.basicConfig(level=logging.INFO)
     print("🧪 Testing scraper directly...")
     result = await run(
         "yugioh blue-eyes white dragon",